@@ -2,6 +2,7 @@
 
 import argparse
 import csv
+import functools
 import io
 import sys
 from pathlib import Path
@@ -46,18 +47,24 @@ def read_blobify_config(git_root: Path, context: Optional[str] = None, debug: bo
         return [], [], [], []
 
     try:
-        contexts = _parse_contexts_with_inheritance(blobify_file, debug)
+        if debug:
+            # Always re-parse in debug mode so the per-line trace is emitted
+            contexts = _parse_contexts_with_inheritance(blobify_file, debug)
+        else:
+            stat = blobify_file.stat()
+            contexts = _parse_blobify_file(blobify_file, stat.st_mtime_ns, stat.st_size)
 
         # Get the target context (default to "default")
         target_context = context if context is not None else "default"
 
         if target_context in contexts:
             config = contexts[target_context]
+            # Hand out copies so callers can't modify the cached parse
             return (
-                config["include_patterns"],
-                config["exclude_patterns"],
-                config["default_switches"],
-                config["llm_instructions"],
+                list(config["include_patterns"]),
+                list(config["exclude_patterns"]),
+                list(config["default_switches"]),
+                list(config["llm_instructions"]),
             )
         else:
             # If a specific context was requested but doesn't exist, that's an error
@@ -83,6 +90,15 @@ def read_blobify_config(git_root: Path, context: Optional[str] = None, debug: bo
         return [], [], [], []
 
 
+@functools.lru_cache(maxsize=64)
+def _parse_blobify_file(blobify_file: Path, mtime_ns: int, size: int) -> Dict[str, Dict]:
+    """
+    Parse a .blobify file once per (path, mtime, size).
+    The stat values are only part of the cache key, so an edited file is re-parsed.
+    """
+    return _parse_contexts_with_inheritance(blobify_file)
+
+
 def _parse_contexts_with_inheritance(blobify_file: Path, debug: bool = False) -> Dict[str, Dict]:
     """
     Parse .blobify file and build contexts with inheritance.
@@ -217,8 +233,8 @@ def _parse_contexts_with_inheritance(blobify_file: Path, debug: bool = False) ->
                         print_debug(f".blobify line {line_num}: Configuration option '{switch_entry}'{context_info}")
 
             elif line.startswith("+"):
-                # Include pattern
-                pattern = line[1:].strip()
+                # Include pattern (interned, as the same globs recur across contexts)
+                pattern = sys.intern(line[1:].strip())
                 if pattern:
                     current_config["include_patterns"].append(pattern)
                     if debug:
@@ -227,7 +243,7 @@ def _parse_contexts_with_inheritance(blobify_file: Path, debug: bool = False) ->
 
             elif line.startswith("-"):
                 # Exclude pattern
-                pattern = line[1:].strip()
+                pattern = sys.intern(line[1:].strip())
                 if pattern:
                     current_config["exclude_patterns"].append(pattern)
                     if debug:
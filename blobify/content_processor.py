@@ -2,10 +2,13 @@
 
 import csv
 import datetime
-import io
+import fnmatch
+import functools
 import mimetypes
+import os
+import re
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Optional, Tuple
 
 import scrubadub
 
@@ -84,8 +87,7 @@ def parse_named_filters(filter_args: list) -> tuple:
 
         try:
             # Use CSV parser to handle quoted, comma-separated values
-            csv_reader = csv.reader(io.StringIO(filter_arg))
-            row = next(csv_reader)
+            row = next(csv.reader([filter_arg]))
 
             if len(row) >= 2:
                 name = row[0].strip()
@@ -126,20 +128,14 @@ def filter_content_lines(content: str, filters: dict, file_path: Path = None, de
     if not filters:
         return content
 
-    import re
-
-    lines = content.split("\n")
-    filtered_lines = []
-    total_matches = 0
-
     # Get applicable filters for this file
     applicable_filters = {}
     if file_path:
-        for name, (pattern, filepattern) in filters.items():
-            # Convert Path to string for pattern matching, always use forward slashes
-            file_str = str(file_path).replace("\\", "/")
-            file_name = file_path.name
+        # Convert Path to string for pattern matching once, always use forward slashes
+        file_str = os.fspath(file_path).replace("\\", "/")
+        file_name = file_path.name
 
+        for name, (pattern, filepattern) in filters.items():
             # Use comprehensive pattern matching
             matches = _matches_glob_pattern(file_str, file_name, filepattern)
 
@@ -156,19 +152,36 @@ def filter_content_lines(content: str, filters: dict, file_path: Path = None, de
     if debug and file_path:
         print_debug(f"Applying {len(applicable_filters)} filters to {file_path}")
 
-    for line in lines:
-        for name, pattern in applicable_filters.items():
-            try:
-                if re.search(pattern, line):
+    # Compile each regex once up front rather than re-parsing it for every line
+    compiled_filters = []
+    for name, pattern in applicable_filters.items():
+        try:
+            compiled_filters.append((name, _compile_filter_regex(pattern)))
+        except re.error as e:
+            if debug:
+                print_warning(f"Invalid regex in filter '{name}': {e}")
+
+    # Nothing can match, so skip splitting the content into lines at all
+    if not compiled_filters and not debug:
+        return ""
+
+    lines = content.split("\n")
+    filtered_lines = []
+    total_matches = 0
+
+    if debug:
+        # Check filters one at a time so the debug output can name the one that matched
+        for line in lines:
+            for name, regex in compiled_filters:
+                if regex.search(line):
                     filtered_lines.append(line)
                     total_matches += 1
-                    if debug:
-                        print_debug(f"Filter '{name}' matched: {line[:50]}...")
+                    print_debug(f"Filter '{name}' matched: {line[:50]}...")
                     break  # Found match, move to next line
-            except re.error as e:
-                if debug:
-                    print_warning(f"Invalid regex in filter '{name}': {e}")
-                continue  # Skip invalid regex
+    else:
+        search_any = _combined_filter_search(tuple(regex for _, regex in compiled_filters))
+        filtered_lines = [line for line in lines if search_any(line)]
+        total_matches = len(filtered_lines)
 
     if debug:
         print_debug(f"Content filtering: {len(lines)} lines -> {len(filtered_lines)} lines ({total_matches} total matches)")
@@ -176,6 +189,51 @@ def filter_content_lines(content: str, filters: dict, file_path: Path = None, de
     return "\n".join(filtered_lines)
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_filter_regex(pattern: str) -> re.Pattern:
+    """Compile a filter regex, cached so the same filter is parsed once across files."""
+    return re.compile(pattern)
+
+
+# Group references and conditionals would point at the wrong group once patterns are joined
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+@functools.lru_cache(maxsize=256)
+def _combined_filter_search(regexes: Tuple[re.Pattern, ...]) -> Callable[[str], object]:
+    """
+    Return a function that tells whether any of the regexes matches a line.
+    Where it is safe, the regexes are joined into one alternation so each line costs a single
+    search call; patterns with global inline flags or group references are searched one by one.
+    """
+    if len(regexes) == 1:
+        return regexes[0].search
+
+    default_flags = re.compile("").flags
+    if all(regex.flags == default_flags and not _GROUP_REFERENCE.search(regex.pattern) for regex in regexes):
+        try:
+            return re.compile("|".join(f"(?:{regex.pattern})" for regex in regexes)).search
+        except re.error:
+            # Patterns that are valid alone can clash when joined, e.g. two filters defining the same group name
+            pass
+
+    return lambda line: any(regex.search(line) for regex in regexes)
+
+
+@functools.lru_cache(maxsize=256)
+def _glob_matcher(pattern: str) -> Callable[[str], Optional[re.Match]]:
+    """
+    Compile a glob pattern once and return its regex match function.
+    Mirrors fnmatch.fnmatch, including os.path.normcase on the pattern.
+    """
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def glob_matches(name: str, pattern: str) -> bool:
+    """Equivalent of fnmatch.fnmatch(name, pattern) using the cached compiled pattern."""
+    return _glob_matcher(pattern)(os.path.normcase(name)) is not None
+
+
 def _matches_glob_pattern(file_path: str, file_name: str, pattern: str) -> bool:
     """
     Check if a file path matches a glob pattern using standard library functions.
@@ -188,15 +246,12 @@ def _matches_glob_pattern(file_path: str, file_name: str, pattern: str) -> bool:
     Returns:
         True if the pattern matches, False otherwise
     """
-    import fnmatch
-    import os
-
     # Handle simple cases first
     if pattern == "*":
         return True
 
     # Try filename match first (most common case)
-    if fnmatch.fnmatch(file_name, pattern):
+    if glob_matches(file_name, pattern):
         return True
 
     # For cross-platform compatibility, we need to test multiple variations
@@ -207,14 +262,14 @@ def _matches_glob_pattern(file_path: str, file_name: str, pattern: str) -> bool:
     normalized_pattern = pattern.replace("\\", "/")
 
     # Try full path match with forward slashes (works well cross-platform)
-    if fnmatch.fnmatch(normalized_file_path, normalized_pattern):
+    if glob_matches(normalized_file_path, normalized_pattern):
         return True
 
     # Also try with native path separators
     native_pattern = normalized_pattern.replace("/", os.sep)
     native_path = normalized_file_path.replace("/", os.sep)
 
-    if fnmatch.fnmatch(native_path, native_pattern):
+    if glob_matches(native_path, native_pattern):
         return True
 
     # Handle ** patterns - these need special treatment
@@ -222,7 +277,7 @@ def _matches_glob_pattern(file_path: str, file_name: str, pattern: str) -> bool:
         # **/*.ext should match any .ext file at any level including root
         if pattern.startswith("**/"):
             ext_pattern = pattern[3:]  # Remove **/
-            if fnmatch.fnmatch(file_name, ext_pattern):
+            if glob_matches(file_name, ext_pattern):
                 return True
 
         # dir/** should match anything in or under dir/
@@ -251,12 +306,12 @@ def _matches_glob_pattern(file_path: str, file_name: str, pattern: str) -> bool:
             # Check if file is in a directory matching the pattern
             if len(path_parts) >= 2:
                 # Check if the directory part matches and the file part matches
-                if fnmatch.fnmatch(path_parts[-2], dir_pattern) and fnmatch.fnmatch(path_parts[-1], file_pattern):
+                if glob_matches(path_parts[-2], dir_pattern) and glob_matches(path_parts[-1], file_pattern):
                     return True
 
                 # Also check if any parent directory matches the pattern
                 for i in range(len(path_parts) - 1):
-                    if fnmatch.fnmatch(path_parts[i], dir_pattern) and fnmatch.fnmatch(file_name, file_pattern):
+                    if glob_matches(path_parts[i], dir_pattern) and glob_matches(file_name, file_pattern):
                         return True
 
     return False
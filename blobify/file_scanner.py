@@ -1,14 +1,13 @@
 """File discovery and pattern matching utilities."""
 
-import fnmatch
 import os
 from pathlib import Path
 from typing import Dict, Optional
 
 from .config import read_blobify_config
 from .console import print_debug, print_phase
-from .content_processor import is_text_file
-from .git_utils import get_gitignore_patterns, is_git_repository, is_ignored_by_git
+from .content_processor import glob_matches, is_text_file
+from .git_utils import get_gitignore_patterns, is_git_repository, make_gitignore_checker
 
 
 def matches_pattern(file_path: Path, base_path: Path, pattern: str) -> bool:
@@ -26,11 +25,11 @@ def matches_pattern(file_path: Path, base_path: Path, pattern: str) -> bool:
             return True
 
         # Try glob pattern matching
-        if fnmatch.fnmatch(relative_path_str, pattern):
+        if glob_matches(relative_path_str, pattern):
             return True
 
         # Try matching just the filename
-        if fnmatch.fnmatch(file_path.name, pattern):
+        if glob_matches(file_path.name, pattern):
             return True
 
         # Try matching directory patterns
@@ -39,7 +38,7 @@ def matches_pattern(file_path: Path, base_path: Path, pattern: str) -> bool:
             dir_pattern = pattern[:-1]
             for parent in relative_path.parents:
                 parent_str = str(parent).replace("\\", "/")
-                if parent_str == dir_pattern or fnmatch.fnmatch(parent_str, dir_pattern):
+                if parent_str == dir_pattern or glob_matches(parent_str, dir_pattern):
                     return True
 
         return False
@@ -133,7 +132,7 @@ def check_if_dot_item_might_be_included(item_name: str, git_root: Path, context:
             if pattern == item_name:
                 return True
             # Wildcard patterns that might match
-            if fnmatch.fnmatch(item_name, pattern):
+            if glob_matches(item_name, pattern):
                 return True
             # Patterns that might match files within this directory (if it's a directory)
             if pattern.startswith(f"{item_name}/") or pattern.startswith(f"{item_name}\\"):
@@ -156,6 +155,7 @@ def discover_files(directory: Path, debug: bool = False) -> Dict:
     # Check if we're in a git repository
     git_root = is_git_repository(directory)
     patterns_by_dir = {}
+    is_gitignored = None
 
     if git_root:
         if debug:
@@ -165,6 +165,8 @@ def discover_files(directory: Path, debug: bool = False) -> Dict:
         total_patterns = sum(len(patterns) for patterns in patterns_by_dir.values())
         if debug:
             print_debug(f"Loaded {total_patterns} gitignore patterns from {len(patterns_by_dir)} locations")
+        if patterns_by_dir:
+            is_gitignored = make_gitignore_checker(git_root, patterns_by_dir)
 
     if debug:
         print_phase("First Sweep: Gitignore & Built-in Exclusions")
@@ -195,9 +197,9 @@ def discover_files(directory: Path, debug: bool = False) -> Dict:
                     continue
 
             # Check if directory is gitignored
-            if git_root and patterns_by_dir:
+            if is_gitignored is not None:
                 try:
-                    is_dir_ignored = is_ignored_by_git(dir_path, git_root, patterns_by_dir, debug)
+                    is_dir_ignored = is_gitignored(dir_path)
                     if is_dir_ignored:
                         # Add directory to gitignored list but don't walk into it
                         relative_dir = dir_path.relative_to(directory)
@@ -227,9 +229,9 @@ def discover_files(directory: Path, debug: bool = False) -> Dict:
 
                 # Check gitignore if we're in a git repo
                 is_git_ignored = False
-                if git_root and patterns_by_dir:
+                if is_gitignored is not None:
                     try:
-                        is_git_ignored = is_ignored_by_git(file_path, git_root, patterns_by_dir, debug)
+                        is_git_ignored = is_gitignored(file_path)
                     except Exception:
                         pass
 
@@ -251,6 +253,7 @@ def discover_files(directory: Path, debug: bool = False) -> Dict:
 
     return {
         "all_files": all_files,
+        "files_by_relpath": {f["relative_path"]: f for f in all_files},
         "gitignored_directories": gitignored_directories,
         "git_root": git_root,
         "patterns_by_dir": patterns_by_dir,
@@ -268,6 +271,12 @@ def apply_blobify_patterns(discovery_context: Dict, directory: Path, context: Op
     if not git_root:
         return
 
+    # Index files by relative path so pattern hits don't rescan the file list
+    files_by_relpath = discovery_context.get("files_by_relpath")
+    if files_by_relpath is None:
+        files_by_relpath = {f["relative_path"]: f for f in all_files}
+        discovery_context["files_by_relpath"] = files_by_relpath
+
     # Load .blobify configuration
     if debug:
         print_phase("Blobify Configuration")
@@ -347,13 +356,15 @@ def apply_blobify_patterns(discovery_context: Dict, directory: Path, context: Op
         for pattern in blobify_include_patterns:
             original_patterns.append(("+", pattern))
 
-    files_to_add = []
+    # Keyed by relative path, insertion order is the order files will be appended
+    files_to_add = {}
 
     # Apply patterns in original file order
     for op, pattern in original_patterns:
         for file_path in all_possible_files:
             if matches_pattern(file_path, git_root, pattern):
                 relative_path = file_path.relative_to(directory)
+                file_info = files_by_relpath.get(relative_path)
 
                 if op == "+":  # Include pattern
                     # Check if this is an exact file match by seeing if the pattern
@@ -370,62 +381,46 @@ def apply_blobify_patterns(discovery_context: Dict, directory: Path, context: Op
                     if not is_exact_match and not is_text_file(file_path):
                         continue
 
-                    # Check if this file is already in our all_files list
-                    found_existing = False
-                    for file_info in all_files:
-                        if file_info["relative_path"] == relative_path:
-                            # File exists, if it was gitignored or excluded, include it
-                            file_info["is_git_ignored"] = False
-                            file_info["is_blobify_excluded"] = False
-                            file_info["is_blobify_included"] = True
-                            file_info["include_in_output"] = True
-                            found_existing = True
-                            if debug:
-                                print_debug(f".blobify INCLUDE: '{relative_path}' by pattern '{pattern}'")
-                            break
-
-                    # If not in list at all, add it (but check files_to_add for duplicates)
-                    if not found_existing:
-                        # Check if already in files_to_add
-                        already_in_to_add = False
-                        for existing_file in files_to_add:
-                            if existing_file["relative_path"] == relative_path:
-                                already_in_to_add = True
-                                break
-
-                        if not already_in_to_add:
-                            files_to_add.append(
-                                {
-                                    "path": file_path,
-                                    "relative_path": relative_path,
-                                    "is_git_ignored": False,
-                                    "is_blobify_excluded": False,
-                                    "is_blobify_included": True,
-                                    "include_in_output": True,
-                                }
-                            )
-                            bypass_msg = " (exact match - bypassing text file check)" if is_exact_match else ""
-                            if debug:
-                                print_debug(f".blobify ADD: '{relative_path}' matches pattern '{pattern}'{bypass_msg}")
-                        elif debug:
-                            print_debug(f".blobify ALREADY ADDED: '{relative_path}' matches pattern '{pattern}' but already in list")
+                    if file_info is not None:
+                        # File exists, if it was gitignored or excluded, include it
+                        file_info["is_git_ignored"] = False
+                        file_info["is_blobify_excluded"] = False
+                        file_info["is_blobify_included"] = True
+                        file_info["include_in_output"] = True
+                        if debug:
+                            print_debug(f".blobify INCLUDE: '{relative_path}' by pattern '{pattern}'")
+
+                    # If not in list at all, add it (unless it's already queued)
+                    elif relative_path not in files_to_add:
+                        files_to_add[relative_path] = {
+                            "path": file_path,
+                            "relative_path": relative_path,
+                            "is_git_ignored": False,
+                            "is_blobify_excluded": False,
+                            "is_blobify_included": True,
+                            "include_in_output": True,
+                        }
+                        bypass_msg = " (exact match - bypassing text file check)" if is_exact_match else ""
+                        if debug:
+                            print_debug(f".blobify ADD: '{relative_path}' matches pattern '{pattern}'{bypass_msg}")
+                    elif debug:
+                        print_debug(f".blobify ALREADY ADDED: '{relative_path}' matches pattern '{pattern}' but already in list")
 
                 else:  # Exclude pattern (op == '-')
                     # Mark as excluded in all_files if present
-                    for file_info in all_files:
-                        if file_info["relative_path"] == relative_path:
-                            file_info["include_in_output"] = False
-                            file_info["is_blobify_excluded"] = True
-                            file_info["is_blobify_included"] = False
-                            if debug:
-                                print_debug(f".blobify EXCLUDE: '{relative_path}' by pattern '{pattern}'")
-                            break
+                    if file_info is not None:
+                        file_info["include_in_output"] = False
+                        file_info["is_blobify_excluded"] = True
+                        file_info["is_blobify_included"] = False
+                        if debug:
+                            print_debug(f".blobify EXCLUDE: '{relative_path}' by pattern '{pattern}'")
 
                     # Remove from files_to_add if present
-                    files_to_add = [f for f in files_to_add if f["relative_path"] != relative_path]
+                    files_to_add.pop(relative_path, None)
 
     # Add new files to the main list
-    all_files.extend(files_to_add)
+    all_files.extend(files_to_add.values())
+    files_by_relpath.update(files_to_add)
 
     if debug:
         print_debug(f"Second sweep: {len(files_to_add)} files added")
@@ -1,9 +1,11 @@
 """Git repository utilities and gitignore handling."""
 
+import functools
+import os
 import re
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .console import print_debug
 
@@ -31,20 +33,9 @@ def get_gitignore_patterns(git_root: Path, debug: bool = False) -> Dict[Path, Li
 
     # Get global gitignore
     global_patterns = []
-    try:
-        result = subprocess.run(
-            ["git", "config", "--get", "core.excludesfile"],
-            cwd=git_root,
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            global_gitignore = Path(result.stdout.strip()).expanduser()
-            if global_gitignore.exists():
-                global_patterns = read_gitignore_file(global_gitignore)
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-        pass
+    global_gitignore = _find_global_gitignore(git_root)
+    if global_gitignore:
+        global_patterns = read_gitignore_file(global_gitignore)
 
     # Add global patterns to git root
     if global_patterns:
@@ -88,6 +79,25 @@ def get_gitignore_patterns(git_root: Path, debug: bool = False) -> Dict[Path, Li
     return patterns_by_dir
 
 
+def _find_global_gitignore(git_root: Path) -> Optional[Path]:
+    """Return the global gitignore file configured by core.excludesfile, if it exists."""
+    try:
+        result = subprocess.run(
+            ["git", "config", "--get", "core.excludesfile"],
+            cwd=git_root,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            global_gitignore = Path(result.stdout.strip()).expanduser()
+            if global_gitignore.exists():
+                return global_gitignore
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
+        pass
+    return None
+
+
 def is_directory_ignored(
     directory: Path,
     git_root: Path,
@@ -113,7 +123,7 @@ def is_directory_ignored(
     for i in range(len(path_parts) + 1):
         # Check if current_dir has gitignore patterns
         if current_dir in patterns_by_dir:
-            compiled_patterns = compile_gitignore_patterns(patterns_by_dir[current_dir])
+            match_gitignore = _gitignore_matcher(tuple(patterns_by_dir[current_dir]))
 
             # Construct the path relative to the current gitignore's directory
             if i == 0:
@@ -124,7 +134,7 @@ def is_directory_ignored(
                 remaining_parts = path_parts[i - 1 :]
                 test_path = "/".join(remaining_parts) if remaining_parts else ""
 
-            if test_path and is_path_ignored_by_patterns(test_path, compiled_patterns, debug):
+            if test_path and match_gitignore(test_path):
                 return True
 
         # Move to the next directory level
@@ -134,39 +144,33 @@ def is_directory_ignored(
     return False
 
 
-def is_path_ignored_by_patterns(path_str: str, compiled_patterns: List[Tuple[re.Pattern, bool]], debug: bool = False) -> bool:
+def read_gitignore_file(gitignore_path: Path) -> List[str]:
     """
-    Check if a path is ignored by a set of compiled gitignore patterns.
+    Read and parse a .gitignore file, returning a list of patterns.
     """
-    is_ignored = False
-
-    for pattern, is_negation in compiled_patterns:
-        matched = pattern.match(path_str)
-
-        if matched:
-            if is_negation:
-                is_ignored = False  # Negation pattern un-ignores the file
-            else:
-                is_ignored = True  # Normal pattern ignores the file
-
-    return is_ignored
+    try:
+        stat = gitignore_path.stat()
+        return list(_parse_gitignore_file(gitignore_path, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        return []
 
 
-def read_gitignore_file(gitignore_path: Path) -> List[str]:
+@functools.lru_cache(maxsize=256)
+def _parse_gitignore_file(gitignore_path: Path, mtime_ns: int, size: int) -> Tuple[str, ...]:
     """
-    Read and parse a .gitignore file, returning a list of patterns.
+    Parse a .gitignore file once per (path, mtime, size).
+    The stat values are only part of the cache key, so an edited file is re-parsed.
     """
+    data = gitignore_path.read_bytes()
+
+    # One read for the whole file; bytes.splitlines matches text-mode universal newlines
     patterns = []
-    try:
-        with open(gitignore_path, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
-                # Skip empty lines and comments
-                if line and not line.startswith("#"):
-                    patterns.append(line)
-    except OSError:
-        pass
-    return patterns
+    for raw_line in data.splitlines():
+        line = raw_line.decode("utf-8", errors="ignore").strip()
+        # Skip empty lines and comments
+        if line and not line.startswith("#"):
+            patterns.append(line)
+    return tuple(patterns)
 
 
 def compile_gitignore_patterns(patterns: List[str]) -> List[Tuple[re.Pattern, bool]]:
@@ -174,23 +178,57 @@ def compile_gitignore_patterns(patterns: List[str]) -> List[Tuple[re.Pattern, bo
     Compile gitignore patterns into regex patterns.
     Returns list of (compiled_pattern, is_negation) tuples.
     """
-    compiled_patterns = []
-
-    for pattern in patterns:
-        is_negation = pattern.startswith("!")
-        if is_negation:
-            pattern = pattern[1:]
-
-        # Convert gitignore pattern to regex
-        regex_pattern = gitignore_to_regex(pattern)
-        try:
-            compiled_pattern = re.compile(regex_pattern)
-            compiled_patterns.append((compiled_pattern, is_negation))
-        except re.error:
-            # Skip invalid regex patterns
-            continue
+    compiled_patterns = (_compile_gitignore_pattern(pattern) for pattern in patterns)
+    # Skip invalid regex patterns
+    return [compiled for compiled in compiled_patterns if compiled is not None]
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_gitignore_pattern(pattern: str) -> Optional[Tuple[re.Pattern, bool]]:
+    """
+    Compile a single gitignore pattern, cached so lines shared between .gitignore files
+    and repeated runs are only translated once. Returns None for an invalid pattern.
+    """
+    is_negation = pattern.startswith("!")
+    if is_negation:
+        pattern = pattern[1:]
+
+    # Convert gitignore pattern to regex
+    try:
+        return re.compile(gitignore_to_regex(pattern)), is_negation
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _gitignore_matcher(patterns: Tuple[str, ...]) -> Callable[[str], Optional[bool]]:
+    """
+    Build a matcher for one gitignore file's patterns, cached per pattern set.
+    The matcher returns True if the path is ignored, False if a negation re-includes it,
+    or None if no pattern matches, so callers can layer nested .gitignore files.
+    """
+    compiled_patterns = compile_gitignore_patterns(list(patterns))
+    if not compiled_patterns:
+        return lambda path_str: None
+
+    # One alternation rejects the common "nothing matches" case in a single regex call
+    any_match = re.compile("|".join(f"(?:{pattern.pattern})" for pattern, _ in compiled_patterns)).match
+    has_negation = any(is_negation for _, is_negation in compiled_patterns)
 
-    return compiled_patterns
+    # The last matching pattern decides, so keep (match, ignored) pairs in reverse order
+    last_pattern_first = tuple((pattern.match, not is_negation) for pattern, is_negation in reversed(compiled_patterns))
+
+    def match(path_str: str) -> Optional[bool]:
+        if not any_match(path_str):
+            return None
+        if not has_negation:
+            return True
+        for pattern_match, ignored in last_pattern_first:
+            if pattern_match(path_str):
+                return ignored
+        return None
+
+    return match
 
 
 def gitignore_to_regex(pattern: str) -> str:
@@ -251,58 +289,85 @@ def gitignore_to_regex(pattern: str) -> str:
     return final_pattern
 
 
-def is_ignored_by_git(
-    file_path: Path,
-    git_root: Path,
-    patterns_by_dir: Dict[Path, List[str]],
-    debug: bool = False,
-) -> bool:
+@functools.lru_cache(maxsize=1024)
+def _relative_dir_prefix(directory: Path, git_root: Path) -> Optional[str]:
     """
-    Check if a file should be ignored based on gitignore patterns.
+    Return directory relative to git_root as a forward-slash string ending in "/",
+    or None if it is outside the repository.
     """
-    # Get relative path from git root
     try:
-        relative_path = file_path.resolve().relative_to(git_root)
+        return os.fspath(directory.relative_to(git_root)).replace("\\", "/") + "/"
     except ValueError:
-        return False
+        return None
 
-    relative_path_str = str(relative_path).replace("\\", "/")
 
-    # Check each gitignore file's patterns
-    is_ignored = False
-
-    # We need to check patterns from git root and all parent directories
-    # Start from the git root and work our way down
+def make_gitignore_checker(git_root: Path, patterns_by_dir: Dict[Path, List[str]]) -> Callable[[Path], bool]:
+    """
+    Build a function that checks whether a path is ignored by the given gitignore patterns.
+    Each .gitignore's matcher and directory prefix are prepared once, so a directory walk
+    only pays for the per-path checks.
+    """
+    # (prefix relative to git root, matcher) for each .gitignore, in load order
+    matchers = []
     for gitignore_dir, patterns in patterns_by_dir.items():
         if not patterns:
             continue
+        if gitignore_dir == git_root:
+            gitignore_prefix = ""
+        else:
+            # This gitignore is in a subdirectory
+            gitignore_prefix = _relative_dir_prefix(gitignore_dir, git_root)
+            if gitignore_prefix is None:
+                continue
+        matchers.append((gitignore_prefix, _gitignore_matcher(tuple(patterns))))
+
+    root_str = os.fspath(git_root)
+    root_prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    normcase_root = os.path.normcase(root_str)
+    normcase_root_prefix = os.path.normcase(root_prefix)
+
+    def is_ignored(file_path: Path) -> bool:
+        # Get relative path from git root by stripping the root prefix from the resolved path
+        path_str = os.fspath(file_path.resolve())
+        if os.path.normcase(path_str) == normcase_root:
+            relative_path_str = "."
+        elif os.path.normcase(path_str[: len(root_prefix)]) == normcase_root_prefix:
+            relative_path_str = path_str[len(root_prefix) :].replace("\\", "/")
+        else:
+            return False
 
-        # Calculate the path relative to this gitignore's directory
-        try:
-            if gitignore_dir == git_root:
+        # Check patterns from the git root down; deeper files override earlier ones
+        ignored = False
+        for gitignore_prefix, match_gitignore in matchers:
+            # Calculate the path relative to this gitignore's directory
+            if not gitignore_prefix:
                 test_path = relative_path_str
+            elif relative_path_str.startswith(gitignore_prefix):
+                # File is in or under this gitignore's directory
+                test_path = relative_path_str[len(gitignore_prefix) :]
+            elif relative_path_str + "/" == gitignore_prefix:
+                test_path = "."
             else:
-                # This gitignore is in a subdirectory
-                gitignore_relative = gitignore_dir.relative_to(git_root)
-                if relative_path.is_relative_to(gitignore_relative):
-                    # File is in or under this gitignore's directory
-                    test_path = str(relative_path.relative_to(gitignore_relative)).replace("\\", "/")
-                else:
-                    # File is not under this gitignore's influence
-                    continue
-        except ValueError:
-            continue
+                # File is not under this gitignore's influence
+                continue
 
-        # Compile and test patterns
-        compiled_patterns = compile_gitignore_patterns(patterns)
+            matched = match_gitignore(test_path)
+            if matched is not None:
+                ignored = matched
 
-        for pattern, is_negation in compiled_patterns:
-            matched = pattern.match(test_path)
-
-            if matched:
-                if is_negation:
-                    is_ignored = False
-                else:
-                    is_ignored = True
+        return ignored
 
     return is_ignored
+
+
+def is_ignored_by_git(
+    file_path: Path,
+    git_root: Path,
+    patterns_by_dir: Dict[Path, List[str]],
+    debug: bool = False,
+) -> bool:
+    """
+    Check if a file should be ignored based on gitignore patterns.
+    To check many paths against the same patterns, build a checker once with make_gitignore_checker.
+    """
+    return make_gitignore_checker(git_root, patterns_by_dir)(file_path)
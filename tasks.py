@@ -83,6 +83,15 @@ def test_verbose(c):
     sys.exit(returncode)
 
 
+@task
+def test_parallel(c):
+    """Run tests in parallel across CPU cores (one worker per test file)."""
+    import sys
+
+    returncode = run_with_formatting(["pytest", "-n", "auto", "--dist", "loadfile"])
+    sys.exit(returncode)
+
+
 @task
 def test_xunit(c):
     """Run tests with xunit XML output."""
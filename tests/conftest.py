@@ -10,6 +10,20 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def _write_files(root, files):
+    """Write {relative_path: content} under root as UTF-8 bytes, creating parent directories."""
+    for relative_path, content in files.items():
+        path = Path(root) / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content.encode("utf-8"))
+
+
+@pytest.fixture(scope="session")
+def write_files():
+    """Provide a helper that bulk-writes test files from a {relative_path: content} mapping."""
+    return _write_files
+
+
 @pytest.fixture
 def sample_files(tmp_path):
     """Create sample test files in the temporary directory."""
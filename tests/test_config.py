@@ -1,8 +1,6 @@
 """Tests for config.py module - Updated for 4-tuple return value."""
 
 import argparse
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
@@ -14,24 +12,13 @@ class TestBlobifyConfig:
     """Test cases for .blobify configuration handling."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests."""
-        temp_dir = Path(tempfile.mkdtemp())
-        yield temp_dir
-        # Cleanup
-        for file in temp_dir.rglob("*"):
-            if file.is_file():
-                file.unlink()
-        temp_dir.rmdir()
-
-    @pytest.fixture
-    def blobify_file(self, temp_dir):
+    def blobify_file(self, tmp_path):
         """Create a .blobify file fixture."""
-        return temp_dir / ".blobify"
+        return tmp_path / ".blobify"
 
-    def test_read_blobify_config_no_file(self, temp_dir):
+    def test_read_blobify_config_no_file(self, tmp_path):
         """Test reading config when no .blobify file exists."""
-        includes, excludes, switches, llm_instructions = read_blobify_config(temp_dir)
+        includes, excludes, switches, llm_instructions = read_blobify_config(tmp_path)
         assert includes == []
         assert excludes == []
         assert switches == []
@@ -146,15 +133,36 @@ invalid_line
         assert excludes == ["valid.log"]
         assert llm_instructions == []
 
-    def test_read_blobify_config_file_read_error(self, temp_dir):
+    def test_read_blobify_config_file_read_error(self, tmp_path):
         """Test handling of file read errors."""
         with patch("builtins.open", side_effect=IOError("Read error")):
-            includes, excludes, switches, llm_instructions = read_blobify_config(temp_dir, debug=True)
+            includes, excludes, switches, llm_instructions = read_blobify_config(tmp_path, debug=True)
             assert includes == []
             assert excludes == []
             assert switches == []
             assert llm_instructions == []
 
+    def test_read_blobify_config_reparses_modified_file(self, blobify_file):
+        """Test that cached parses are invalidated when the .blobify file changes."""
+        blobify_file.write_text("+*.py\n")
+        includes, _, _, _ = read_blobify_config(blobify_file.parent)
+        assert includes == ["*.py"]
+
+        blobify_file.write_text("+*.py\n+*.md\n")
+        includes, _, _, _ = read_blobify_config(blobify_file.parent)
+        assert includes == ["*.py", "*.md"]
+
+    def test_read_blobify_config_returns_independent_lists(self, blobify_file):
+        """Test that mutating returned patterns does not leak into later calls."""
+        blobify_file.write_text("+*.py\n-*.log\n")
+        includes, excludes, _, _ = read_blobify_config(blobify_file.parent)
+        includes.append("*.md")
+        excludes.clear()
+
+        includes, excludes, _, _ = read_blobify_config(blobify_file.parent)
+        assert includes == ["*.py"]
+        assert excludes == ["*.log"]
+
     def test_apply_default_switches_no_switches(self):
         """Test applying empty default switches."""
         args = argparse.Namespace(debug=False, output_filename=None)
@@ -1,11 +1,35 @@
 """Tests for context inheritance functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
 from blobify.config import get_available_contexts, list_available_contexts, read_blobify_config
-from blobify.main import main
+from blobify.main import _run, main
+
+
+@pytest.fixture(scope="module")
+def single_level_blobify_dir(tmp_path_factory):
+    """Write a .blobify with single-level inheritance once for the whole module."""
+    root = tmp_path_factory.mktemp("single_level")
+    (root / ".blobify").write_text(
+        """
+# Default has exclusions first
+-*.log
++*.py
+@copy-to-clipboard=true
+
+[extended:default]
+# Inherits from default
++*.md
+-secret.txt
+
+[child:default]
+# Child adds more patterns
++*.md
+-secret.txt
+@debug=true
+"""
+    )
+    return root
 
 
 class TestContextInheritance:
@@ -35,34 +59,20 @@ class TestContextInheritance:
         assert excludes == ["*.log"]
         assert switches == ["copy-to-clipboard=true"]
 
-    def test_single_level_inheritance(self, tmp_path):
-        """Test basic single-level inheritance."""
-        blobify_file = tmp_path / ".blobify"
-        blobify_file.write_text(
-            """
-# Default context
-@copy-to-clipboard=true
-+*.py
--*.log
-
-[extended:default]
-# Inherits from default
-+*.md
--secret.txt
-"""
-        )
-
-        # Test default context
-        includes, excludes, switches, _ = read_blobify_config(tmp_path, "default")
-        assert includes == ["*.py"]
-        assert excludes == ["*.log"]
-        assert switches == ["copy-to-clipboard=true"]
-
-        # Test extended context (should inherit from default)
-        includes, excludes, switches, _ = read_blobify_config(tmp_path, "extended")
-        assert includes == ["*.py", "*.md"]  # Inherited + own
-        assert excludes == ["*.log", "secret.txt"]  # Inherited + own
-        assert switches == ["copy-to-clipboard=true"]  # Inherited
+    @pytest.mark.parametrize(
+        "context,expected_includes,expected_excludes,expected_switches",
+        [
+            ("default", ["*.py"], ["*.log"], ["copy-to-clipboard=true"]),
+            ("extended", ["*.py", "*.md"], ["*.log", "secret.txt"], ["copy-to-clipboard=true"]),
+            ("child", ["*.py", "*.md"], ["*.log", "secret.txt"], ["copy-to-clipboard=true", "debug=true"]),
+        ],
+    )
+    def test_single_level_inheritance(self, single_level_blobify_dir, context, expected_includes, expected_excludes, expected_switches):
+        """Test single-level inheritance, with parent patterns ordered before the child's own."""
+        includes, excludes, switches, _ = read_blobify_config(single_level_blobify_dir, context)
+        assert includes == expected_includes
+        assert excludes == expected_excludes
+        assert switches == expected_switches
 
     def test_multi_level_inheritance(self, tmp_path):
         """Test multi-level inheritance chain."""
@@ -132,39 +142,15 @@ class TestContextInheritance:
         with pytest.raises(ValueError, match="Parent context\\(s\\) not found: nonexistent"):
             read_blobify_config(tmp_path, "child", debug=True)
 
-    def test_inheritance_preserves_pattern_order(self, tmp_path):
-        """Test that inheritance preserves the order of patterns."""
-        blobify_file = tmp_path / ".blobify"
-        blobify_file.write_text(
-            """
-# Default has exclusions first
--*.log
-+*.py
-@copy-to-clipboard=true
-
-[child:default]
-# Child adds more patterns
-+*.md
--secret.txt
-@debug=true
-"""
-        )
-
-        includes, excludes, switches, _ = read_blobify_config(tmp_path, "child")
-
-        # Order should be: parent patterns first, then child patterns
-        assert includes == ["*.py", "*.md"]
-        assert excludes == ["*.log", "secret.txt"]
-        assert switches == ["copy-to-clipboard=true", "debug=true"]
-
-    def test_context_inheritance_with_blobify_patterns_file_order(self, tmp_path):
+    def test_context_inheritance_with_blobify_patterns_file_order(self, tmp_path, write_files):
         """Test that inherited patterns maintain the file order for pattern application."""
         # Create git repo
         (tmp_path / ".git").mkdir()
 
-        blobify_file = tmp_path / ".blobify"
-        blobify_file.write_text(
-            """
+        write_files(
+            tmp_path,
+            {
+                ".blobify": """
 # Default: exclude all, then include Python
 -**
 +*.py
@@ -172,17 +158,15 @@ class TestContextInheritance:
 [docs:default]
 # Inherit exclusion, add markdown
 +*.md
-"""
+""",
+                "app.py": "print('app')",
+                "README.md": "# README",
+                "config.xml": "<config/>",
+            },
         )
 
-        # Create test files
-        (tmp_path / "app.py").write_text("print('app')")
-        (tmp_path / "README.md").write_text("# README")
-        (tmp_path / "config.xml").write_text("<config/>")
-
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "docs", "--output-filename", str(output_file)]):
-            main()
+        _run(tmp_path, output_file, context="docs")
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -257,14 +241,15 @@ class TestContextInheritance:
         assert "[extended:base]" in captured.out
         assert "# Inherits @copy-to-clipboard=true and +*.py from base" in captured.out
 
-    def test_context_inheritance_with_filter_defaults(self, tmp_path):
+    def test_context_inheritance_with_filter_defaults(self, tmp_path, write_files):
         """Test that filter defaults are properly inherited."""
         # Create git repo
         (tmp_path / ".git").mkdir()
 
-        blobify_file = tmp_path / ".blobify"
-        blobify_file.write_text(
-            """
+        write_files(
+            tmp_path,
+            {
+                ".blobify": """
 # Default with filter
 @filter="functions","^def"
 +*.py
@@ -272,19 +257,14 @@ class TestContextInheritance:
 [enhanced:default]
 @filter="classes","^class"
 +*.js
-"""
+""",
+                "test.py": "def hello():\n    pass\nclass Test:\n    pass",
+                "test.js": "function greet() {}\nclass Component {}",
+            },
         )
 
-        # Create test files
-        py_file = tmp_path / "test.py"
-        py_file.write_text("def hello():\n    pass\nclass Test:\n    pass")
-
-        js_file = tmp_path / "test.js"
-        js_file.write_text("function greet() {}\nclass Component {}")
-
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "enhanced", "--output-filename", str(output_file)]):
-            main()
+        _run(tmp_path, output_file, context="enhanced")
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -338,12 +318,11 @@ class TestContextInheritance:
         (tmp_path / "test.py").write_text("print('test')")
 
         # Test with non-existent context
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "nonexistent-context"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tmp_path), "-x", "nonexistent-context"])
 
-            # Should exit with code 1
-            assert exc_info.value.code == 1
+        # Should exit with code 1
+        assert exc_info.value.code == 1
 
         captured = capsys.readouterr()
         assert "Context 'nonexistent-context' not found in .blobify file" in captured.err
@@ -366,11 +345,10 @@ class TestContextInheritance:
         (tmp_path / "test.py").write_text("print('test')")
 
         # Test with non-existent context
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "some-context"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
+        with pytest.raises(SystemExit) as exc_info:
+            main([str(tmp_path), "-x", "some-context"])
 
-            assert exc_info.value.code == 1
+        assert exc_info.value.code == 1
 
         captured = capsys.readouterr()
         assert "Context 'some-context' not found in .blobify file" in captured.err
@@ -393,8 +371,7 @@ class TestContextInheritance:
         output_file = tmp_path / "output.txt"
 
         # Should work fine with no context specified (uses default)
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()  # Should not raise SystemExit
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         # Should produce normal output
         content = output_file.read_text(encoding="utf-8")
@@ -569,6 +546,22 @@ class TestContextInheritance:
         with pytest.raises(ValueError, match="Parent context\\(s\\) not found: late"):
             read_blobify_config(tmp_path, "early", debug=True)
 
+    def test_cyclic_inheritance_rejected(self, tmp_path):
+        """Test that mutually inheriting contexts fail fast instead of recursing."""
+        blobify_file = tmp_path / ".blobify"
+        blobify_file.write_text(
+            """
+[a:b]
++*.py
+
+[b:a]
++*.md
+"""
+        )
+
+        with pytest.raises(ValueError, match="Parent context\\(s\\) not found: b"):
+            read_blobify_config(tmp_path, "a")
+
     def test_cannot_define_context_twice(self, tmp_path):
         """Test that defining the same context twice raises an error."""
         blobify_file = tmp_path / ".blobify"
@@ -825,8 +818,7 @@ class TestContextInheritance:
         (tmp_path / "config.xml").write_text("<config/>")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "combined", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "combined", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
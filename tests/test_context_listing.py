@@ -1,7 +1,5 @@
 """Tests for context listing functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
 from blobify.config import get_available_contexts, get_context_descriptions, list_available_contexts
@@ -234,8 +232,7 @@ class TestContextListing:
 """
         )
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x"]):
-            main()
+        main([str(tmp_path), "-x"])
 
         captured = capsys.readouterr()
         assert "Available contexts:" in captured.out
@@ -259,8 +256,7 @@ class TestContextListing:
 """
         )
 
-        with patch("sys.argv", ["bfy", "-x"]):
-            main()
+        main(["-x"])
 
         captured = capsys.readouterr()
         assert "Available contexts:" in captured.out
@@ -271,8 +267,7 @@ class TestContextListing:
         # Change to temp directory
         monkeypatch.chdir(tmp_path)
 
-        with patch("sys.argv", ["bfy", "-x"]):
-            main()
+        main(["-x"])
 
         captured = capsys.readouterr()
         assert "No .blobify file found in current directory." in captured.out
@@ -291,8 +286,7 @@ class TestContextListing:
 """
         )
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--context"]):
-            main()
+        main([str(tmp_path), "--context"])
 
         captured = capsys.readouterr()
         assert "Available contexts:" in captured.out
@@ -351,8 +345,7 @@ class TestContextListing:
         (tmp_path / "test.py").write_text("print('hello')")
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "test-ctx", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "test-ctx", "--output-filename", str(output_file)])
 
         # Should process files normally, not list contexts
         content = output_file.read_text(encoding="utf-8")
@@ -361,9 +354,8 @@ class TestContextListing:
 
     def test_context_flag_nonexistent_directory_error(self, capsys):
         """Test that -x with nonexistent directory shows error."""
-        with patch("sys.argv", ["bfy", "/nonexistent/path", "-x"]):
-            with pytest.raises(SystemExit):
-                main()
+        with pytest.raises(SystemExit):
+            main(["/nonexistent/path", "-x"])
 
         captured = capsys.readouterr()
         assert "Directory does not exist" in captured.err
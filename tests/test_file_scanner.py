@@ -1,6 +1,5 @@
 """Tests for file_scanner.py module."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -50,20 +49,17 @@ class TestFileScanner:
         result = matches_pattern(test_file, tmp_path, "*.js")
         assert result is False
 
-    def test_matches_pattern_outside_base(self):
+    def test_matches_pattern_outside_base(self, tmp_path):
         """Test pattern matching with file outside base path."""
-        other_dir = Path(tempfile.mkdtemp())
-        temp_dir = Path(tempfile.mkdtemp())
+        other_dir = tmp_path / "other"
+        base_dir = tmp_path / "base"
+        other_dir.mkdir()
+        base_dir.mkdir()
         test_file = other_dir / "test.py"
         test_file.write_text("test")
 
-        try:
-            result = matches_pattern(test_file, temp_dir, "*.py")
-            assert result is False
-        finally:
-            test_file.unlink()
-            other_dir.rmdir()
-            temp_dir.rmdir()
+        result = matches_pattern(test_file, base_dir, "*.py")
+        assert result is False
 
     def test_get_built_in_ignored_patterns(self):
         """Test getting built-in ignored patterns."""
@@ -101,12 +97,12 @@ class TestFileScanner:
 
     @patch("blobify.file_scanner.is_git_repository")
     @patch("blobify.file_scanner.get_gitignore_patterns")
-    @patch("blobify.file_scanner.is_ignored_by_git")
-    def test_discover_files_with_git(self, mock_is_ignored, mock_get_patterns, mock_is_git, tmp_path):
+    @patch("blobify.file_scanner.make_gitignore_checker")
+    def test_discover_files_with_git(self, mock_make_checker, mock_get_patterns, mock_is_git, tmp_path):
         """Test discover_files with git repository."""
         mock_is_git.return_value = tmp_path
         mock_get_patterns.return_value = {tmp_path: ["*.log"]}
-        mock_is_ignored.side_effect = lambda path, *args: path.suffix == ".log"
+        mock_make_checker.return_value = lambda path: path.suffix == ".log"
 
         # Create test files
         (tmp_path / "test.py").write_text("test")
@@ -118,8 +114,8 @@ class TestFileScanner:
         assert len(context["all_files"]) == 2
 
         # Check git ignored status
-        log_file = next(f for f in context["all_files"] if f["relative_path"].name == "test.log")
-        py_file = next(f for f in context["all_files"] if f["relative_path"].name == "test.py")
+        log_file = context["files_by_relpath"][Path("test.log")]
+        py_file = context["files_by_relpath"][Path("test.py")]
 
         assert log_file["is_git_ignored"] is True
         assert py_file["is_git_ignored"] is False
@@ -134,17 +130,58 @@ class TestFileScanner:
         assert context["all_files"] == []
 
     @patch("blobify.file_scanner.read_blobify_config")
-    def test_apply_blobify_patterns_with_config(self, mock_read_config, tmp_path):
+    def test_apply_blobify_patterns_with_config(self, mock_read_config, tmp_path, write_files):
         """Test apply_blobify_patterns with .blobify configuration."""
         # Fix: Return 4-tuple to match expected signature
         mock_read_config.return_value = (["*.py"], ["*.log"], [], [])
 
         # Create test files
-        (tmp_path / "test.py").write_text("test")
-        (tmp_path / "test.log").write_text("log")
-        (tmp_path / "README.md").write_text("readme")
+        write_files(tmp_path, {"test.py": "test", "test.log": "log", "README.md": "readme"})
 
         # Initial context with all files marked as git ignored
+        all_files = [
+            {
+                "path": tmp_path / "test.py",
+                "relative_path": Path("test.py"),
+                "is_git_ignored": True,
+                "is_blobify_excluded": False,
+                "is_blobify_included": False,
+                "include_in_output": False,
+            },
+            {
+                "path": tmp_path / "README.md",
+                "relative_path": Path("README.md"),
+                "is_git_ignored": False,
+                "is_blobify_excluded": False,
+                "is_blobify_included": False,
+                "include_in_output": True,
+            },
+        ]
+        context = {
+            "all_files": all_files,
+            "files_by_relpath": {f["relative_path"]: f for f in all_files},
+            "git_root": tmp_path,
+            "patterns_by_dir": {},
+        }
+
+        apply_blobify_patterns(context, tmp_path)
+
+        # Check that test.py was included by .blobify
+        py_file = context["files_by_relpath"][Path("test.py")]
+        assert py_file["is_blobify_included"] is True
+        assert py_file["include_in_output"] is True
+
+        # Check that README.md was not affected
+        md_file = context["files_by_relpath"][Path("README.md")]
+        assert md_file["is_blobify_included"] is False
+
+    @patch("blobify.file_scanner.read_blobify_config")
+    def test_apply_blobify_patterns_builds_missing_index(self, mock_read_config, tmp_path):
+        """Test apply_blobify_patterns indexes contexts that arrive without files_by_relpath."""
+        mock_read_config.return_value = (["*.py"], [], [], [])
+        (tmp_path / "test.py").write_text("test")
+        (tmp_path / "extra.py").write_text("extra")
+
         context = {
             "all_files": [
                 {
@@ -155,14 +192,6 @@ class TestFileScanner:
                     "is_blobify_included": False,
                     "include_in_output": False,
                 },
-                {
-                    "path": tmp_path / "README.md",
-                    "relative_path": Path("README.md"),
-                    "is_git_ignored": False,
-                    "is_blobify_excluded": False,
-                    "is_blobify_included": False,
-                    "include_in_output": True,
-                },
             ],
             "git_root": tmp_path,
             "patterns_by_dir": {},
@@ -170,14 +199,11 @@ class TestFileScanner:
 
         apply_blobify_patterns(context, tmp_path)
 
-        # Check that test.py was included by .blobify
-        py_file = next(f for f in context["all_files"] if f["relative_path"].name == "test.py")
-        assert py_file["is_blobify_included"] is True
-        assert py_file["include_in_output"] is True
-
-        # Check that README.md was not affected
-        md_file = next(f for f in context["all_files"] if f["relative_path"].name == "README.md")
-        assert md_file["is_blobify_included"] is False
+        # Existing entry updated in place, new file appended and indexed exactly once
+        assert len(context["all_files"]) == 2
+        assert context["files_by_relpath"][Path("test.py")] is context["all_files"][0]
+        assert context["files_by_relpath"][Path("test.py")]["include_in_output"] is True
+        assert context["files_by_relpath"][Path("extra.py")]["is_blobify_included"] is True
 
     @patch("blobify.file_scanner.discover_files")
     @patch("blobify.file_scanner.apply_blobify_patterns")
@@ -1,7 +1,6 @@
 """Tests for file-targeted filter functionality."""
 
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -254,20 +253,7 @@ SELECT * FROM users WHERE name = 'admin';
         self.setup_multi_language_project(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"py-functions","^def","*.py"',
-                "--filter",
-                '"py-classes","^class","*.py"',
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"py-functions","^def","*.py"', "--filter", '"py-classes","^class","*.py"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -291,10 +277,8 @@ SELECT * FROM users WHERE name = 'admin';
         self.setup_multi_language_project(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
+        main(
             [
-                "bfy",
                 str(tmp_path),
                 "--filter",
                 '"js-functions","^function","*.js"',
@@ -304,9 +288,8 @@ SELECT * FROM users WHERE name = 'admin';
                 '"js-constants","^const","*.js"',
                 "--output-filename",
                 str(output_file),
-            ],
-        ):
-            main()
+            ]
+        )
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -325,18 +308,7 @@ SELECT * FROM users WHERE name = 'admin';
         self.setup_multi_language_project(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"css-selectors","^[.#]","*.css"',
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"css-selectors","^[.#]","*.css"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -355,10 +327,8 @@ SELECT * FROM users WHERE name = 'admin';
 
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
+        main(
             [
-                "bfy",
                 str(tmp_path),
                 "--filter",
                 '"sql-ddl","^(CREATE|ALTER)","migrations/*.sql"',
@@ -368,9 +338,8 @@ SELECT * FROM users WHERE name = 'admin';
                 str(output_file),
                 "--debug",
                 "true",
-            ],
-        ):
-            main()
+            ]
+        )
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -388,10 +357,8 @@ SELECT * FROM users WHERE name = 'admin';
         self.setup_multi_language_project(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
+        main(
             [
-                "bfy",
                 str(tmp_path),
                 "--filter",
                 '"backend-functions","^def","*.py"',
@@ -401,9 +368,8 @@ SELECT * FROM users WHERE name = 'admin';
                 '"styles","^[.#]","*.css"',
                 "--output-filename",
                 str(output_file),
-            ],
-        ):
-            main()
+            ]
+        )
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -434,10 +400,8 @@ SELECT * FROM users WHERE name = 'admin';
 
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
+        main(
             [
-                "bfy",
                 str(tmp_path),
                 "--filter",
                 '"migration-sql","^(CREATE|INSERT)","migrations/*.sql"',
@@ -447,9 +411,8 @@ SELECT * FROM users WHERE name = 'admin';
                 str(output_file),
                 "--debug",
                 "true",
-            ],
-        ):
-            main()
+            ]
+        )
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -467,11 +430,7 @@ SELECT * FROM users WHERE name = 'admin';
 
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            ["bfy", str(tmp_path), "--filter", '"py-only","^def","*.py"', "--output-filename", str(output_file)],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"py-only","^def","*.py"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -511,8 +470,7 @@ SELECT * FROM users WHERE name = 'admin';
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -542,11 +500,7 @@ SELECT * FROM users WHERE name = 'admin';
 
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            ["bfy", str(tmp_path), "--filter", '"classes","^class"', "--output-filename", str(output_file)],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"classes","^class"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -1,7 +1,6 @@
 """Tests for the --filter functionality."""
 
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -247,11 +246,7 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            ["bfy", str(tmp_path), "--filter", '"functions","^(def|function)"', "--output-filename", str(output_file)],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^(def|function)"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -276,20 +271,7 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"py-functions","^def","*.py"',
-                "--filter",
-                '"js-functions","^function","*.js"',
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"py-functions","^def","*.py"', "--filter", '"js-functions","^function","*.js"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -310,10 +292,8 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
+        main(
             [
-                "bfy",
                 str(tmp_path),
                 "--filter",
                 '"functions","^(def|function)"',
@@ -323,9 +303,8 @@ const x = 42;
                 '"returns","return"',
                 "--output-filename",
                 str(output_file),
-            ],
-        ):
-            main()
+            ]
+        )
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -351,19 +330,7 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"functions","^(def|function)"',
-                "--show-excluded=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^(def|function)"', "--show-excluded=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -382,19 +349,7 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"functions","^def"',
-                "--output-content=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^def"', "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -412,8 +367,7 @@ const x = 42;
         """Test that CLI summary shows filter count."""
         self.setup_test_files(tmp_path)
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--filter", '"functions","^def"', "--filter", '"imports","^import"']):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^def"', "--filter", '"imports","^import"'])
 
         captured = capsys.readouterr()
         assert "with 2 content filters" in captured.err
@@ -440,8 +394,7 @@ const x = 42;
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "filtered", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "filtered", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -461,8 +414,7 @@ const x = 42;
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -485,8 +437,7 @@ const x = 42;
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -503,8 +454,7 @@ const x = 42;
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--filter", '"functions","^def"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -525,21 +475,7 @@ class TestFilterErrorHandling:
 
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"invalid","[unclosed"',
-                "--filter",
-                '"valid","^def"',
-                "--debug=true",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"invalid","[unclosed"', "--filter", '"valid","^def"', "--debug=true", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -573,8 +509,7 @@ class TestFilterBlobifyIntegration:
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -608,8 +543,7 @@ class TestFilterBlobifyIntegration:
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -639,8 +573,7 @@ class TestFilterBlobifyIntegration:
 
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--filter", '"classes","^class"', "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--filter", '"classes","^class"', "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -688,8 +621,7 @@ class TestFilterBlobifyIntegration:
 
         # Test signatures context
         output_file1 = tmp_path / "signatures.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "signatures", "--output-filename", str(output_file1)]):
-            main()
+        main([str(tmp_path), "-x", "signatures", "--output-filename", str(output_file1)])
 
         content1 = output_file1.read_text(encoding="utf-8")
         assert "signatures: ^(def|class)" in content1
@@ -699,8 +631,7 @@ class TestFilterBlobifyIntegration:
 
         # Test py-imports context (file-targeted)
         output_file2 = tmp_path / "imports.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "py-imports", "--output-filename", str(output_file2)]):
-            main()
+        main([str(tmp_path), "-x", "py-imports", "--output-filename", str(output_file2)])
 
         content2 = output_file2.read_text(encoding="utf-8")
         assert "imports: ^import (files: *.py)" in content2
@@ -710,8 +641,7 @@ class TestFilterBlobifyIntegration:
 
         # Test js-functions context (file-targeted)
         output_file3 = tmp_path / "js-funcs.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "js-functions", "--output-filename", str(output_file3)]):
-            main()
+        main([str(tmp_path), "-x", "js-functions", "--output-filename", str(output_file3)])
 
         content3 = output_file3.read_text(encoding="utf-8")
         assert "js-funcs: ^function (files: *.js)" in content3
@@ -1,16 +1,18 @@
 """Tests for git_utils.py module."""
 
 import subprocess
-import tempfile
-from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from blobify.git_utils import (
+    _find_global_gitignore,
     compile_gitignore_patterns,
     get_gitignore_patterns,
     gitignore_to_regex,
     is_git_repository,
     is_ignored_by_git,
+    make_gitignore_checker,
     read_gitignore_file,
 )
 
@@ -26,6 +28,28 @@ class TestGitUtils:
         result = is_git_repository(tmp_path)
         assert result == tmp_path
 
+    def test_is_git_repository_notices_repository_changes(self, tmp_path):
+        """Test repeat lookups pick up a .git directory being created or removed."""
+        assert is_git_repository(tmp_path) is None
+
+        git_dir = tmp_path / ".git"
+        git_dir.mkdir()
+        assert is_git_repository(tmp_path) == tmp_path
+        assert is_git_repository(tmp_path) == tmp_path
+
+        git_dir.rmdir()
+        assert is_git_repository(tmp_path) is None
+
+    def test_is_git_repository_notices_nested_repository(self, tmp_path):
+        """Test a nested repository created after a lookup takes over from the outer one."""
+        (tmp_path / ".git").mkdir()
+        sub_dir = tmp_path / "vendor" / "lib"
+        sub_dir.mkdir(parents=True)
+        assert is_git_repository(sub_dir) == tmp_path
+
+        (tmp_path / "vendor" / ".git").mkdir()
+        assert is_git_repository(sub_dir) == tmp_path / "vendor"
+
     def test_is_git_repository_not_found(self, tmp_path):
         """Test is_git_repository when no .git directory exists."""
         result = is_git_repository(tmp_path)
@@ -57,33 +81,50 @@ build/
         patterns = read_gitignore_file(gitignore)
         assert patterns == ["*.log", "temp/", "build/"]
 
+    def test_read_gitignore_file_crlf_and_invalid_utf8(self, tmp_path):
+        """Test Windows line endings and undecodable bytes are handled like text-mode reads."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_bytes(b"# Comment\r\n*.log\r\ntemp\xff/\rbuild/\r\n")
+
+        patterns = read_gitignore_file(gitignore)
+        assert patterns == ["*.log", "temp/", "build/"]
+
+    def test_read_gitignore_file_rereads_modified_file(self, tmp_path):
+        """Test cached .gitignore parses are refreshed when the file changes."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.log\n")
+        assert read_gitignore_file(gitignore) == ["*.log"]
+
+        gitignore.write_text("*.log\nbuild/\n")
+        assert read_gitignore_file(gitignore) == ["*.log", "build/"]
+
+    def test_read_gitignore_file_returns_independent_lists(self, tmp_path):
+        """Test callers can extend the returned list without affecting later reads."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("*.log\n")
+
+        read_gitignore_file(gitignore).append("*.tmp")
+        assert read_gitignore_file(gitignore) == ["*.log"]
+
     def test_read_gitignore_file_nonexistent(self, tmp_path):
         """Test reading nonexistent .gitignore file."""
         gitignore = tmp_path / ".gitignore"
         patterns = read_gitignore_file(gitignore)
         assert patterns == []
 
-    def test_gitignore_to_regex_simple(self):
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            ("*.log", "^([^/]*\\.log|.*/[^/]*\\.log)$"),
+            ("build/", "^(build|build/.*|.*/build|.*/build/.*)$"),
+            ("/build", "^build$"),
+            ("docs/**", "^(docs/.*|.*/docs/.*)$"),
+        ],
+        ids=["simple", "directory", "root-relative", "doublestar"],
+    )
+    def test_gitignore_to_regex(self, pattern, expected):
         """Test gitignore pattern to regex conversion."""
-        regex = gitignore_to_regex("*.log")
-        assert regex == "^([^/]*\\.log|.*/[^/]*\\.log)$"
-
-    def test_gitignore_to_regex_directory(self):
-        """Test gitignore directory pattern to regex conversion."""
-        regex = gitignore_to_regex("build/")
-        expected = "^(build|build/.*|.*/build|.*/build/.*)$"
-        assert regex == expected
-
-    def test_gitignore_to_regex_root_relative(self):
-        """Test gitignore root-relative pattern to regex conversion."""
-        regex = gitignore_to_regex("/build")
-        assert regex == "^build$"
-
-    def test_gitignore_to_regex_doublestar(self):
-        """Test gitignore doublestar pattern to regex conversion."""
-        regex = gitignore_to_regex("docs/**")
-        expected = "^(docs/.*|.*/docs/.*)$"
-        assert regex == expected
+        assert gitignore_to_regex(pattern) == expected
 
     def test_compile_gitignore_patterns(self):
         """Test compiling gitignore patterns to regex."""
@@ -103,8 +144,7 @@ build/
         # Should skip invalid pattern
         assert len(compiled) == 1
 
-    @patch("blobify.git_utils.subprocess.run")
-    def test_get_gitignore_patterns_with_global(self, mock_run, tmp_path):
+    def test_get_gitignore_patterns_with_global(self, tmp_path):
         """Test getting gitignore patterns including global gitignore."""
         # Setup git directory
         git_dir = tmp_path / ".git"
@@ -118,13 +158,8 @@ build/
         repo_gitignore = tmp_path / ".gitignore"
         repo_gitignore.write_text("*.log\n")
 
-        # Mock git config command
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = str(global_gitignore)
-        mock_run.return_value = mock_result
-
-        patterns_by_dir = get_gitignore_patterns(tmp_path)
+        with patch("blobify.git_utils._find_global_gitignore", return_value=global_gitignore):
+            patterns_by_dir = get_gitignore_patterns(tmp_path)
 
         # Should include both global and repo patterns
         assert tmp_path in patterns_by_dir
@@ -132,8 +167,7 @@ build/
         assert "*.tmp" in patterns
         assert "*.log" in patterns
 
-    @patch("blobify.git_utils.subprocess.run")
-    def test_get_gitignore_patterns_no_global(self, mock_run, tmp_path):
+    def test_get_gitignore_patterns_no_global(self, tmp_path):
         """Test getting gitignore patterns without global gitignore."""
         # Setup git directory
         git_dir = tmp_path / ".git"
@@ -143,18 +177,36 @@ build/
         repo_gitignore = tmp_path / ".gitignore"
         repo_gitignore.write_text("*.log\n")
 
-        # Mock git config command (no global gitignore)
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_run.return_value = mock_result
-
-        patterns_by_dir = get_gitignore_patterns(tmp_path)
+        with patch("blobify.git_utils._find_global_gitignore", return_value=None):
+            patterns_by_dir = get_gitignore_patterns(tmp_path)
 
         # Should only include repo patterns
         assert tmp_path in patterns_by_dir
         patterns = patterns_by_dir[tmp_path]
         assert patterns == ["*.log"]
 
+    @patch("blobify.git_utils.subprocess.run")
+    def test_get_gitignore_patterns_global_file_missing(self, mock_run, tmp_path):
+        """Test a core.excludesfile pointing at a missing file is skipped."""
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        mock_run.return_value = Mock(returncode=0, stdout=f"{tmp_path / 'missing.gitignore'}\n")
+
+        patterns_by_dir = get_gitignore_patterns(tmp_path)
+
+        assert mock_run.call_args[0][0] == ["git", "config", "--get", "core.excludesfile"]
+        assert patterns_by_dir[tmp_path] == ["*.log"]
+
+    @patch("blobify.git_utils.subprocess.run")
+    def test_find_global_gitignore_from_git_config_command(self, mock_run, tmp_path):
+        """Test the global gitignore comes from 'git config --get core.excludesfile'."""
+        global_gitignore = tmp_path / "global.gitignore"
+        global_gitignore.write_text("*.tmp\n")
+        mock_run.return_value = Mock(returncode=0, stdout=f"{global_gitignore}\n")
+
+        assert _find_global_gitignore(tmp_path) == global_gitignore
+        assert mock_run.call_args[0][0] == ["git", "config", "--get", "core.excludesfile"]
+
     def test_get_gitignore_patterns_git_error(self, tmp_path):
         """Test getting gitignore patterns when git command fails."""
         # Setup git directory
@@ -206,6 +258,41 @@ build/
         result = is_ignored_by_git(test_file, tmp_path, patterns_by_dir)
         assert result is False
 
+    def test_is_ignored_by_git_last_matching_pattern_wins(self, tmp_path):
+        """Test a negation only re-includes files when it comes after the matching pattern."""
+        test_file = tmp_path / "important.log"
+        test_file.write_text("test")
+
+        patterns_by_dir = {tmp_path: ["!important.log", "*.log"]}
+
+        result = is_ignored_by_git(test_file, tmp_path, patterns_by_dir)
+        assert result is True
+
+    def test_is_ignored_by_git_nested_negation(self, tmp_path):
+        """Test a subdirectory .gitignore negation overrides the root patterns."""
+        sub_dir = tmp_path / "logs"
+        sub_dir.mkdir()
+        test_file = sub_dir / "keep.log"
+        test_file.write_text("test")
+
+        patterns_by_dir = {tmp_path: ["*.log"], sub_dir: ["!keep.log"]}
+
+        assert is_ignored_by_git(test_file, tmp_path, patterns_by_dir) is False
+        assert is_ignored_by_git(sub_dir / "other.log", tmp_path, patterns_by_dir) is True
+
+    def test_make_gitignore_checker_reused_across_paths(self, tmp_path):
+        """Test one checker built from nested patterns answers for many paths."""
+        sub_dir = tmp_path / "logs"
+        patterns_by_dir = {tmp_path: ["*.log", "build/"], sub_dir: ["!keep.log"]}
+
+        is_ignored = make_gitignore_checker(tmp_path, patterns_by_dir)
+
+        assert is_ignored(tmp_path / "app.log") is True
+        assert is_ignored(tmp_path / "build" / "out.txt") is True
+        assert is_ignored(sub_dir / "keep.log") is False
+        assert is_ignored(sub_dir / "other.log") is True
+        assert is_ignored(tmp_path / "app.py") is False
+
     def test_is_ignored_by_git_not_ignored(self, tmp_path):
         """Test is_ignored_by_git with non-ignored file."""
         # Create test file
@@ -218,18 +305,25 @@ build/
         result = is_ignored_by_git(test_file, tmp_path, patterns_by_dir)
         assert result is False
 
-    def test_is_ignored_by_git_file_outside_repo(self, tmp_path):
+    def test_is_ignored_by_git_sibling_with_shared_prefix(self, tmp_path):
+        """Test a file in a sibling directory whose name extends the repo name is outside the repo."""
+        repo = tmp_path / "repo"
+        sibling = tmp_path / "repo2"
+        repo.mkdir()
+        sibling.mkdir()
+        test_file = sibling / "test.log"
+        test_file.write_text("test")
+
+        assert is_ignored_by_git(test_file, repo, {repo: ["*.log"]}) is False
+
+    def test_is_ignored_by_git_file_outside_repo(self, tmp_path, tmp_path_factory):
         """Test is_ignored_by_git with file outside repository."""
         # Create file outside tmp_path
-        other_dir = Path(tempfile.mkdtemp())
+        other_dir = tmp_path_factory.mktemp("outside")
         test_file = other_dir / "test.log"
         test_file.write_text("test")
 
-        try:
-            patterns_by_dir = {tmp_path: ["*.log"]}
+        patterns_by_dir = {tmp_path: ["*.log"]}
 
-            result = is_ignored_by_git(test_file, tmp_path, patterns_by_dir)
-            assert result is False
-        finally:
-            test_file.unlink()
-            other_dir.rmdir()
+        result = is_ignored_by_git(test_file, tmp_path, patterns_by_dir)
+        assert result is False
@@ -1,7 +1,5 @@
 """Tests for the --list-patterns=ignored feature."""
 
-from unittest.mock import patch
-
 from blobify.main import list_ignored_patterns, main
 
 
@@ -10,8 +8,7 @@ class TestListIgnoredFeature:
 
     def test_list_ignored_patterns_option(self, capsys):
         """Test --list-patterns=ignored option."""
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored"]):
-            main()
+        main(["--list-patterns=ignored"])
 
         captured = capsys.readouterr()
         assert "Built-in ignored patterns:" in captured.out
@@ -22,8 +19,7 @@ class TestListIgnoredFeature:
 
     def test_list_ignored_patterns_categories(self, capsys):
         """Test that patterns are properly categorised."""
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored"]):
-            main()
+        main(["--list-patterns=ignored"])
 
         captured = capsys.readouterr()
         output = captured.out
@@ -60,8 +56,7 @@ class TestListIgnoredFeature:
         (tmp_path / "test.py").write_text("print('should not be processed')")
 
         # Test that the --list-patterns=ignored flag works and doesn't process files
-        with patch("sys.argv", ["bfy", str(tmp_path), "--list-patterns=ignored"]):
-            main()
+        main([str(tmp_path), "--list-patterns=ignored"])
 
         # Verify that the list was printed (which means the function worked)
         captured = capsys.readouterr()
@@ -73,8 +68,7 @@ class TestListIgnoredFeature:
 
     def test_list_ignored_patterns_with_other_flags_ignored(self, capsys):
         """Test that other flags are ignored when --list-patterns=ignored is used."""
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored", "--debug=true", "--copy-to-clipboard=true"]):
-            main()
+        main(["--list-patterns=ignored", "--debug=true", "--copy-to-clipboard=true"])
 
         captured = capsys.readouterr()
         # Should still show ignored patterns, other flags should be ignored
@@ -153,8 +147,7 @@ class TestListIgnoredFeature:
 
     def test_list_ignored_patterns_no_directory_needed(self, capsys):
         """Test that --list-patterns=ignored works without specifying a directory."""
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored"]):
-            main()
+        main(["--list-patterns=ignored"])
 
         captured = capsys.readouterr()
         assert "Built-in ignored patterns:" in captured.out
@@ -169,8 +162,7 @@ class TestListIgnoredFeature:
         actual_patterns = get_built_in_ignored_patterns()
 
         # Run list command
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored"]):
-            main()
+        main(["--list-patterns=ignored"])
 
         captured = capsys.readouterr()
         output = captured.out
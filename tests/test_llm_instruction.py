@@ -1,7 +1,5 @@
 """Tests for LLM instructions functionality (double-hash comments)."""
 
-from unittest.mock import patch
-
 import pytest
 
 from blobify.config import read_blobify_config
@@ -221,8 +219,7 @@ class TestLLMInstructions:
         (tmp_path / "app.py").write_text("print('hello')")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -258,8 +255,7 @@ class TestLLMInstructions:
         (tmp_path / "script.js").write_text("console.log('world');")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "code-review", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "code-review", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -293,8 +289,7 @@ class TestLLMInstructions:
         (tmp_path / "script.js").write_text("console.log('world');")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "extended", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "extended", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -327,8 +322,7 @@ class TestLLMInstructions:
         (tmp_path / "script.js").write_text("console.log('world');")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "base", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "base", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -355,8 +349,7 @@ class TestLLMInstructions:
         (tmp_path / "app.py").write_text("print('hello')")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -447,8 +440,7 @@ class TestLLMInstructions:
         (tmp_path / "app.py").write_text("def hello():\n    print('world')\nclass Test:\n    pass")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -1,7 +1,5 @@
 """Tests for the --show-excluded functionality."""
 
-from unittest.mock import patch
-
 import pytest
 
 from blobify.main import main
@@ -47,8 +45,7 @@ class TestShowExcluded:
         self.setup_test_environment(tmp_path)
         output_file = tmp_path / "output_default.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -77,8 +74,7 @@ class TestShowExcluded:
         self.setup_test_environment(tmp_path)
         output_file = tmp_path / "output_suppressed.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--show-excluded=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--show-excluded=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -110,18 +106,7 @@ class TestShowExcluded:
         self.setup_test_environment(tmp_path)
         output_file = tmp_path / "output_no_content.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--show-excluded=false",
-                "--output-content=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--show-excluded=false", "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -145,18 +130,7 @@ class TestShowExcluded:
         self.setup_test_environment(tmp_path)
         output_file = tmp_path / "output_metadata_only.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--show-excluded=false",
-                "--output-content=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--show-excluded=false", "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -191,8 +165,7 @@ class TestShowExcluded:
 
         output_file = tmp_path / "output_default_switch.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -218,8 +191,7 @@ class TestShowExcluded:
         output_file = tmp_path / "output_override.txt"
 
         # Run without any show-excluded flag - should use .blobify default
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "START_FILE: debug.log" not in content  # Suppressed by default
@@ -252,8 +224,7 @@ class TestShowExcluded:
 
         output_file = tmp_path / "output_context.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "strict", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "strict", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -297,18 +268,7 @@ class TestShowExcluded:
 
         # Test with --output-line-numbers=false
         output_file = tmp_path / "output_no_lines.txt"
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--show-excluded=false",
-                "--output-line-numbers=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--show-excluded=false", "--output-line-numbers=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "START_FILE: app.py" in content
@@ -321,18 +281,7 @@ class TestShowExcluded:
         self.setup_test_environment(tmp_path)
         output_file = tmp_path / "output_clean.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--show-excluded=false",
-                "--output-metadata=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--show-excluded=false", "--output-metadata=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -363,19 +312,7 @@ class TestShowExcluded:
 
         output_file = tmp_path / "output_filters.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--filter",
-                '"py-functions","^def","*.py"',
-                "--show-excluded=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--filter", '"py-functions","^def","*.py"', "--show-excluded=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
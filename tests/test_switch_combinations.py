@@ -1,7 +1,5 @@
 """Tests for all switch combinations - comprehensive coverage of configuration options."""
 
-from unittest.mock import patch
-
 from blobify.main import main
 
 
@@ -32,8 +30,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -56,8 +53,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-content=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -80,8 +76,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-index=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-index=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -99,8 +94,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-metadata=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-metadata=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -121,18 +115,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--output-content=false",
-                "--output-index=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-index=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -156,18 +139,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--output-content=false",
-                "--output-metadata=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-metadata=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -184,18 +156,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--output-index=false",
-                "--output-metadata=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--output-index=false", "--output-metadata=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -215,19 +176,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
         output_file = tmp_path / "output.txt"
 
-        with patch(
-            "sys.argv",
-            [
-                "bfy",
-                str(tmp_path),
-                "--output-content=false",
-                "--output-index=false",
-                "--output-metadata=false",
-                "--output-filename",
-                str(output_file),
-            ],
-        ):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-index=false", "--output-metadata=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -261,8 +210,7 @@ class TestConfigurationOptionCombinations:
         for switches, expected_desc in test_cases:
             output_file = tmp_path / f"output_{'_'.join(s.replace('--', '').replace('=', '_') for s in switches)}.txt"
 
-            with patch("sys.argv", ["bfy", str(tmp_path)] + switches + ["--output-filename", str(output_file)]):
-                main()
+            main([str(tmp_path)] + switches + ["--output-filename", str(output_file)])
 
             content = output_file.read_text(encoding="utf-8")
             assert expected_desc in content, f"Failed for {switches}: expected '{expected_desc}' in header"
@@ -273,8 +221,7 @@ class TestConfigurationOptionCombinations:
 
         # With content: should show status labels in index and metadata
         output_file = tmp_path / "with_content.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "[FILE CONTENTS IGNORED BY GITIGNORE]" in content
@@ -283,8 +230,7 @@ class TestConfigurationOptionCombinations:
 
         # Without content: should NOT show status labels anywhere
         output_file2 = tmp_path / "no_content.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-content=false", "--output-filename", str(output_file2)]):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-filename", str(output_file2)])
 
         content2 = output_file2.read_text(encoding="utf-8")
         assert "[FILE CONTENTS IGNORED BY GITIGNORE]" not in content2
@@ -296,8 +242,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
 
         output_file = tmp_path / "with_lines.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "1: print('hello world')" in content
@@ -307,8 +252,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
 
         output_file = tmp_path / "no_line_numbers.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-line-numbers=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-line-numbers=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "print('hello world')" in content  # Content present
@@ -319,8 +263,7 @@ class TestConfigurationOptionCombinations:
         self.setup_test_files(tmp_path)
 
         output_file = tmp_path / "no_content.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-content=false", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
         assert "1: print('hello world')" not in content
@@ -352,11 +295,7 @@ class TestConfigurationOptionsWithContext:
         (tmp_path / "README.md").write_text("# README")
 
         output_file = tmp_path / "output.txt"
-        with patch(
-            "sys.argv",
-            ["bfy", str(tmp_path), "-x", "docs-only", "--output-content=false", "--output-filename", str(output_file)],
-        ):
-            main()
+        main([str(tmp_path), "-x", "docs-only", "--output-content=false", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -391,8 +330,7 @@ class TestConfigurationOptionsWithContext:
         (tmp_path / "config.xml").write_text("<config/>")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "minimal", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "minimal", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -424,8 +362,7 @@ class TestConfigurationOptionsWithContext:
         (tmp_path / "README.md").write_text("# README content")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "docs-only", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "docs-only", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -460,8 +397,7 @@ class TestConfigurationOptionsWithContext:
         (tmp_path / "test.js").write_text("function js_func() {\n    console.log('js');\n}\nconst x = 1;")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "filtered", "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "-x", "filtered", "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -539,8 +475,7 @@ class TestConfigurationOptionDefaults:
         (tmp_path / "test.py").write_text("print('should not appear')")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
@@ -569,8 +504,7 @@ class TestConfigurationOptionDefaults:
         (tmp_path / "test.js").write_text("function js_func() {\n    console.log('hello');\n}")
 
         output_file = tmp_path / "output.txt"
-        with patch("sys.argv", ["bfy", str(tmp_path), "--output-filename", str(output_file)]):
-            main()
+        main([str(tmp_path), "--output-filename", str(output_file)])
 
         content = output_file.read_text(encoding="utf-8")
 
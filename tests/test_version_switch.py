@@ -1,7 +1,5 @@
 """Tests for the --version/-v command line switch."""
 
-from unittest.mock import patch
-
 from blobify.main import __version__, main
 
 
@@ -10,8 +8,7 @@ class TestVersionSwitch:
 
     def test_version_long_flag(self, capsys):
         """Test --version flag shows version and exits."""
-        with patch("sys.argv", ["bfy", "--version"]):
-            main()
+        main(["--version"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out
@@ -21,8 +18,7 @@ class TestVersionSwitch:
 
     def test_version_short_flag(self, capsys):
         """Test -v flag shows version and exits."""
-        with patch("sys.argv", ["bfy", "-v"]):
-            main()
+        main(["-v"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out
@@ -35,8 +31,7 @@ class TestVersionSwitch:
         # Create test files that would normally be processed
         (tmp_path / "test.py").write_text("print('should not be processed')")
 
-        with patch("sys.argv", ["bfy", str(tmp_path), "--version", "--debug=true"]):
-            main()
+        main([str(tmp_path), "--version", "--debug=true"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out
@@ -57,8 +52,7 @@ class TestVersionSwitch:
         (tmp_path / "test.py").write_text("print('test')")
 
         # Test with context flag
-        with patch("sys.argv", ["bfy", str(tmp_path), "-x", "test-context", "--version"]):
-            main()
+        main([str(tmp_path), "-x", "test-context", "--version"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out
@@ -67,8 +61,7 @@ class TestVersionSwitch:
 
         # Test with list patterns
         capsys.readouterr()  # Clear previous output
-        with patch("sys.argv", ["bfy", "--list-patterns=ignored", "--version"]):
-            main()
+        main(["--list-patterns=ignored", "--version"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out
@@ -76,8 +69,7 @@ class TestVersionSwitch:
 
     def test_version_output_format(self, capsys):
         """Test that version output has correct format."""
-        with patch("sys.argv", ["bfy", "--version"]):
-            main()
+        main(["--version"])
 
         captured = capsys.readouterr()
         # Should be simple format: "blobify <version>"
@@ -88,8 +80,7 @@ class TestVersionSwitch:
     def test_version_exits_cleanly(self, capsys):
         """Test that --version exits without errors."""
         # Should not raise any exceptions
-        with patch("sys.argv", ["bfy", "--version"]):
-            main()
+        main(["--version"])
 
         captured = capsys.readouterr()
         assert "blobify " + __version__ in captured.out